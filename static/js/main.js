@@ -24,13 +24,23 @@ document.addEventListener('DOMContentLoaded', function() {
     // Auto-refresh auction status
     initAutoRefresh();
     initLiveBidRefresh();
+    // Admin bid history: paging + live new bids
+    initAdminBidHistory();
+    // Index: load further cards per section
+    initAuctionBrowser();
+    // Admin dashboard: bulk selection
+    initBulkSelect();
     // Smooth page transitions (progressive enhancement)
     initPageTransitions();
 
 
     // PWA: register service worker
     if ('serviceWorker' in navigator) {
-        navigator.serviceWorker.register('/static/sw.js').catch(function(err) {
+        // Older versions registered /static/sw.js, whose scope only covered /static/
+        navigator.serviceWorker.getRegistrations().then(function(regs) {
+            regs.filter(r => r.scope.endsWith('/static/')).forEach(r => r.unregister());
+        }).catch(function() {});
+        navigator.serviceWorker.register('/sw.js').catch(function(err) {
             console.warn('ServiceWorker registration failed:', err);
         });
     }
@@ -38,58 +48,137 @@ document.addEventListener('DOMContentLoaded', function() {
 
 // Countdown Timer
 function initCountdowns() {
-    const countdowns = document.querySelectorAll('[data-countdown]');
-    countdowns.forEach(el => {
-        const endDate = new Date(el.dataset.countdown);
-        updateCountdown(el, endDate);
-        setInterval(() => updateCountdown(el, endDate), 1000);
+    document.querySelectorAll('[data-countdown]').forEach(el => {
+        countdownTicker.add(el, new Date(el.dataset.countdown));
     });
 }
 
-function updateCountdown(element, endDate) {
-    const now = new Date();
-    const diff = endDate - now;
-    
-    if (diff <= 0) {
-        element.innerHTML = '<span class="countdown-ended">Veiling afgelopen</span>';
-        if (!element.__endedNotified) {
-            element.__endedNotified = true;
-            if (typeof window.__zoltaForceRefresh === 'function') {
-                window.__zoltaForceRefresh();
+/**
+ * One shared ticker for every countdown on the page. It wakes up once per second, aligned to
+ * the second boundary and inside requestAnimationFrame, and only writes countdowns that are on
+ * screen and whose digits changed. Time is corrected by the offset to the server clock taken
+ * from state responses (server_time), which also covers devices in another timezone.
+ */
+const countdownTicker = (function() {
+    const entries = new Map();
+    let skew = 0;
+    let bestRtt = Infinity;
+    let timer = null;
+
+    const observer = ('IntersectionObserver' in window)
+        ? new IntersectionObserver(items => {
+            items.forEach(item => {
+                const entry = entries.get(item.target);
+                if (!entry) return;
+                entry.visible = item.isIntersecting;
+                if (entry.visible) render(item.target, entry, now());
+            });
+        })
+        : null;
+
+    function now() {
+        return Date.now() + skew;
+    }
+
+    function schedule() {
+        if (timer !== null || !entries.size || document.hidden) return;
+        const delay = 1000 - (now() % 1000) + 5;
+        timer = setTimeout(() => requestAnimationFrame(tick), delay);
+    }
+
+    function tick() {
+        timer = null;
+        const t = now();
+        entries.forEach((entry, el) => {
+            // Keep ticking off-screen countdowns that run out, so the page still learns the auction ended
+            if (entry.visible || entry.end - t <= 0) render(el, entry, t);
+        });
+        schedule();
+    }
+
+    function render(el, entry, t) {
+        const diff = entry.end - t;
+        if (diff <= 0) {
+            el.innerHTML = '<span class="countdown-ended">Veiling afgelopen</span>';
+            remove(el);
+            if (typeof window.__zoltaForceRefresh === 'function') window.__zoltaForceRefresh();
+            return;
+        }
+        const parts = [
+            Math.floor(diff / 86400000),
+            Math.floor((diff % 86400000) / 3600000),
+            Math.floor((diff % 3600000) / 60000),
+            Math.floor((diff % 60000) / 1000)
+        ].map((v, i) => i === 0 ? String(v) : String(v).padStart(2, '0'));
+
+        if (!entry.values) {
+            const labels = ['Dagen', 'Uur', 'Minuten', 'Seconden'];
+            el.innerHTML = labels.map(label => `
+                <div class="countdown-item">
+                    <span class="countdown-value"></span>
+                    <span class="countdown-label">${label}</span>
+                </div>`).join('');
+            entry.values = Array.from(el.querySelectorAll('.countdown-value'));
+            entry.shown = [];
+        }
+        parts.forEach((text, i) => {
+            if (entry.shown[i] !== text) {
+                entry.values[i].textContent = text;
+                entry.shown[i] = text;
             }
+        });
+    }
+
+    function add(el, end) {
+        if (isNaN(end)) return;
+        const existing = entries.get(el);
+        if (existing) {
+            existing.end = end.getTime();
+        } else {
+            entries.set(el, { end: end.getTime(), visible: !observer, values: null, shown: [] });
+            if (observer) observer.observe(el);
         }
-        return;
+        render(el, entries.get(el), now());
+        schedule();
     }
-    
-    const days = Math.floor(diff / (1000 * 60 * 60 * 24));
-    const hours = Math.floor((diff % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
-    const minutes = Math.floor((diff % (1000 * 60 * 60)) / (1000 * 60));
-    const seconds = Math.floor((diff % (1000 * 60)) / 1000);
-    
-    element.innerHTML = `
-        <div class="countdown-item">
-            <span class="countdown-value">${days}</span>
-            <span class="countdown-label">Dagen</span>
-        </div>
-        <div class="countdown-item">
-            <span class="countdown-value">${hours.toString().padStart(2, '0')}</span>
-            <span class="countdown-label">Uur</span>
-        </div>
-        <div class="countdown-item">
-            <span class="countdown-value">${minutes.toString().padStart(2, '0')}</span>
-            <span class="countdown-label">Minuten</span>
-        </div>
-        <div class="countdown-item">
-            <span class="countdown-value">${seconds.toString().padStart(2, '0')}</span>
-            <span class="countdown-label">Seconden</span>
-        </div>
-    `;
-}
+
+    function remove(el) {
+        entries.delete(el);
+        if (observer) observer.unobserve(el);
+    }
+
+    // Keep the sample with the shortest round trip: its midpoint is the best estimate
+    function syncServerTime(serverTime, sentAt, receivedAt) {
+        const server = new Date(serverTime).getTime();
+        const rtt = receivedAt - sentAt;
+        if (isNaN(server) || rtt < 0 || rtt > bestRtt) return;
+        bestRtt = rtt;
+        skew = server - (sentAt + rtt / 2);
+    }
+
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden) {
+            if (timer === null) tick();
+        } else if (timer !== null) {
+            clearTimeout(timer);
+            timer = null;
+        }
+    });
+
+    return { add, remove, now, syncServerTime };
+})();
 
 // Bid Form Handling
 function initBidForms() {
     const bidForm = document.getElementById('bid-form');
     if (!bidForm) return;
+
+    // One Idempotency-Key per bid: a retry of the same bid (double tap, lost connection) reuses it,
+    // so the server replays its first answer instead of bidding or mailing twice.
+    let pendingBid = null; // { payload, key }
+    const newIdempotencyKey = () => (window.crypto && crypto.randomUUID)
+        ? crypto.randomUUID()
+        : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}${Math.random().toString(36).slice(2)}`;
     
     bidForm.addEventListener('submit', async function(e) {
         e.preventDefault();
@@ -106,15 +195,24 @@ function initBidForms() {
             email: bidForm.querySelector('[name="email"]').value,
             amount: parseFloat(bidForm.querySelector('[name="amount"]').value)
         };
+        const maxInput = bidForm.querySelector('[name="max_amount"]');
+        if (maxInput && maxInput.value) formData.max_amount = parseFloat(maxInput.value);
+        const payload = JSON.stringify(formData);
+        if (!pendingBid || pendingBid.payload !== payload) {
+            pendingBid = { payload, key: newIdempotencyKey() };
+        }
         
         try {
             const response = await fetch(`/api/auction/${auctionId}/bid`, {
                 method: 'POST',
                 headers: {
-                    'Content-Type': 'application/json'
+                    'Content-Type': 'application/json',
+                    'Idempotency-Key': pendingBid.key
                 },
-                body: JSON.stringify(formData)
+                body: payload
             });
+            // Final answer (not "still processing" or a server error): the next bid gets a new key
+            if (response.status !== 409 && response.status < 500) pendingBid = null;
             
             const rawText = await response.text();
             let data = null;
@@ -145,6 +243,8 @@ function initBidForms() {
                     // Bid will be placed after email confirmation
                     return;
                 }
+                if (data.outbid) showMessage('info', data.message);
+                if (maxInput) maxInput.value = '';
                 // Update current price display
                 updatePriceDisplay(data.new_price);
                 // Refresh bid list
@@ -216,6 +316,11 @@ function updateMinBid(currentPrice) {
 }
 
 async function refreshBidList(auctionId) {
+    // The auction page poller applies the full state; just poll it now
+    if (typeof window.__zoltaForceRefresh === 'function') {
+        window.__zoltaForceRefresh();
+        return;
+    }
     try {
         const response = await fetch(`/api/auction/${auctionId}/state`, { cache: 'no-store' });
         if (!response.ok) return;
@@ -229,28 +334,8 @@ async function refreshBidList(auctionId) {
         // Update list
         const list = document.getElementById('recent-bids');
         if (list && Array.isArray(data.bids)) {
-            const header = `
-                <div class="bid-header" aria-hidden="true">
-                    <div>Naam</div>
-                    <div>Datum</div>
-                    <div class="text-right">Bod</div>
-                </div>`;
-
-            if (data.bids.length === 0) {
-                list.innerHTML = header + '<div class="empty-bids">Nog geen biedingen.</div>';
-            } else {
-                list.innerHTML = header + data.bids.map((b, idx) => {
-                    const dt = new Date(b.created_at);
-                    const ts = isNaN(dt) ? '' : dt.toLocaleString('nl-NL');
-                    const winning = idx === 0 ? ' winning' : '';
-                    return `
-                        <div class="bid-item${winning}">
-                            <div class="bid-name">${escapeHtml(b.name)}</div>
-                            <div class="bid-time">${escapeHtml(ts)}</div>
-                            <div class="bid-amount">€${Number(b.amount).toFixed(2)}</div>
-                        </div>`;
-                }).join('');
-            }
+            patchBidList(list, data.bids, true);
+            if (data.cursor != null) list.dataset.cursor = data.cursor;
         }
 
         // Update min bid input based on latest price
@@ -262,66 +347,100 @@ async function refreshBidList(auctionId) {
 
 // Auto-refresh auction status
 function initAutoRefresh() {
-    // Index page: reload when an upcoming auction should go live
-    const indexMarker = document.querySelector('[data-page="index"]');
-    if (indexMarker) {
-        const upcomingCards = document.querySelectorAll('[data-auction-start]');
-        if (upcomingCards.length) {
-            setInterval(() => {
-                const now = new Date();
-                for (const card of upcomingCards) {
-                    const start = new Date(card.dataset.auctionStart);
-                    if (!isNaN(start) && now >= start) {
-                        window.location.reload();
-                        return;
-                    }
-                }
-            }, 30000);
-        }
-        return;
-    }
+    // Index page: live prices and statuses for the cards on screen
+    if (document.querySelector('[data-page="index"]')) initIndexLiveState();
+    // Auction pages are polled by the adaptive poller in initLiveBidRefresh
+}
 
-    const auctionInfo = document.querySelector('[data-auction-id]');
-    if (!auctionInfo) return;
-    
-    const auctionId = auctionInfo.dataset.auctionId;
-    
-    // Refresh every 30 seconds
-    setInterval(async () => {
-        try {
-            const response = await fetch(`/api/auction/${auctionId}/status`);
-            const data = await response.json();
-            
-            // Update price if changed
-            const priceEl = document.getElementById('current-price');
-            if (priceEl) {
-                const displayPrice = `€${data.current_price.toFixed(2)}`;
-                if (priceEl.textContent !== displayPrice) {
-                    priceEl.textContent = displayPrice;
-                    priceEl.classList.add('price-updated');
-                    setTimeout(() => priceEl.classList.remove('price-updated'), 500);
-                    updateMinBid(data.current_price);
-                }
-            }
-            
-            // Update bid count
-            const bidCountEl = document.getElementById('bid-count');
-            if (bidCountEl) {
-                bidCountEl.textContent = data.bid_count;
-            }
-            
-            // Check if auction ended
-            if (data.status === 'ended') {
-                const bidForm = document.getElementById('bid-form');
-                if (bidForm) {
-                    bidForm.innerHTML = '<div class="alert alert-info">Deze veiling is afgelopen.</div>';
-                    // stop polling? (auto)
-                }
-            }
-        } catch (error) {
-            console.error('Failed to refresh auction status:', error);
+/**
+ * Index page: poll /api/auctions/state for the cards in view and patch price, bid count and
+ * status in place (an upcoming card turns live, a live card turns ended) without reloading.
+ */
+function initIndexLiveState() {
+    const cards = () => document.querySelectorAll('.auction-card[data-card-id]');
+    if (!cards().length) return;
+
+    // Only cards near the viewport are polled; without IntersectionObserver all cards are
+    const visible = new Set();
+    const observer = ('IntersectionObserver' in window)
+        ? new IntersectionObserver(entries => {
+            entries.forEach(e => {
+                if (e.isIntersecting) visible.add(e.target.dataset.cardId);
+                else visible.delete(e.target.dataset.cardId);
+            });
+        }, { rootMargin: '200px' })
+        : null;
+    const observed = new WeakSet();
+    const observeNewCards = () => {
+        if (!observer) return;
+        cards().forEach(card => {
+            if (!observed.has(card)) { observed.add(card); observer.observe(card); }
+        });
+    };
+
+    const poll = async () => {
+        observeNewCards();
+        const ids = observer
+            ? Array.from(visible)
+            : Array.from(cards()).map(c => c.dataset.cardId);
+        // Ended cards don't change any more; skip them
+        const live = ids.filter(id => {
+            const card = document.querySelector(`.auction-card[data-card-id="${id}"]`);
+            return card && card.dataset.status !== 'ended';
+        }).slice(0, 100);
+        if (!live.length) return { changed: false };
+
+        const sentAt = Date.now();
+        const res = await fetch(`/api/auctions/state?ids=${live.join(',')}`, { cache: 'no-store' });
+        if (res.status === 503) return shedPoll(res);
+        if (!res.ok) throw new Error(`state ${res.status}`);
+        const hint = parseFloat(res.headers.get('X-Poll-Interval'));
+        const data = await res.json();
+        if (data.server_time) countdownTicker.syncServerTime(data.server_time, sentAt, Date.now());
+        let changed = false;
+        Object.entries(data.auctions || {}).forEach(([id, state]) => {
+            const card = document.querySelector(`.auction-card[data-card-id="${id}"]`);
+            if (card && updateAuctionCard(card, state)) changed = true;
+        });
+        return { changed, hint: isNaN(hint) ? null : hint };
+    };
+
+    const poller = createAdaptivePoller(poll, {
+        initialDelay: 10000,
+        // Stay quick around the next start time of an upcoming card
+        msUntilDeadline: () => {
+            let next = null;
+            document.querySelectorAll('.auction-card[data-status="upcoming"][data-auction-start]').forEach(card => {
+                const left = new Date(card.dataset.auctionStart) - countdownTicker.now();
+                if (!isNaN(left) && (next === null || left < next)) next = left;
+            });
+            return next;
         }
-    }, 30000);
+    });
+    // Give the observer a moment to report which cards are on screen
+    setTimeout(() => poller.start(), 1000);
+}
+
+// Returns true when the card changed
+function updateAuctionCard(card, state) {
+    if (!state || state.status === 'inactive') return false;
+    const version = String(state.version || 0);
+    if (card.dataset.status === state.status && card.dataset.version === version) return false;
+    card.dataset.version = version;
+    card.dataset.status = state.status;
+    // An upcoming card keeps its server-rendered start line
+    if (state.status === 'upcoming') return true;
+
+    const { priceLine, meta } = auctionCardSummary(state);
+    const priceEl = card.querySelector('.auction-card-price');
+    const metaEl = card.querySelector('.auction-card-meta');
+    if (priceEl && priceEl.innerHTML !== priceLine) {
+        priceEl.innerHTML = priceLine;
+        priceEl.classList.add('price-updated');
+        setTimeout(() => priceEl.classList.remove('price-updated'), 500);
+    }
+    if (metaEl && metaEl.innerHTML !== meta) metaEl.innerHTML = meta;
+    return true;
 }
 
 // Format currency
@@ -425,30 +544,7 @@ const detail = document.querySelector('.auction-detail-grid[data-auction-id]');
         if (bidCountEl) bidCountEl.textContent = data.bid_count;
 
         const list = document.getElementById('recent-bids');
-        if (list && Array.isArray(data.bids)) {
-            const header = `
-                <div class="bid-header" aria-hidden="true">
-                    <div>Naam</div>
-                    <div>Datum</div>
-                    <div class="text-right">Bod</div>
-                </div>`;
-
-            if (data.bids.length === 0) {
-                list.innerHTML = header + '<div class="empty-bids">Nog geen biedingen.</div>';
-            } else {
-                list.innerHTML = header + data.bids.map((b, idx) => {
-                    const dt = new Date(b.created_at);
-                    const ts = isNaN(dt) ? '' : dt.toLocaleString('nl-NL');
-                    const winning = idx === 0 ? ' winning' : '';
-                    return `
-                        <div class="bid-item${winning}">
-                            <div class="bid-name">${escapeHtml(b.name)}</div>
-                            <div class="bid-time">${escapeHtml(ts)}</div>
-                            <div class="bid-amount">€${Number(b.amount).toFixed(2)}</div>
-                        </div>`;
-                }).join('');
-            }
-        }
+        if (list && Array.isArray(data.bids)) patchBidList(list, data.bids, !data.delta);
 
         applyAuctionStatusUI(data);
 
@@ -458,11 +554,36 @@ const detail = document.querySelector('.auction-detail-grid[data-auction-id]');
         }
     };
 
+    let endDate = null;
+    let lastSignature = null;
+
+    const bidList = document.getElementById('recent-bids');
+    const countdown = document.querySelector('.countdown[data-countdown]');
+
     const fetchState = async () => {
-        try {
-            const res = await fetch(`/api/auction/${auctionId}/state`, { cache: 'no-store' });
-            if (!res.ok) return;
-            const data = await res.json();
+        // Send our bid cursor so the server only returns bids we don't have yet
+        const cursor = bidList ? bidList.dataset.cursor : '';
+        const query = cursor ? `?since=${encodeURIComponent(cursor)}` : '';
+        const sentAt = Date.now();
+        const res = await fetch(`/api/auction/${auctionId}/state${query}`, { cache: 'no-store' });
+        if (res.status === 503) return shedPoll(res);
+        if (!res.ok) throw new Error(`state ${res.status}`);
+        const hint = parseFloat(res.headers.get('X-Poll-Interval'));
+        const data = await res.json();
+        if (data.server_time && !data.final) countdownTicker.syncServerTime(data.server_time, sentAt, Date.now());
+        if (data.end_date) {
+            const newEnd = new Date(data.end_date);
+            // An admin may have moved the end date
+            if (countdown && data.status !== 'ended' && (!endDate || newEnd.getTime() !== endDate.getTime())) {
+                countdownTicker.add(countdown, newEnd);
+            }
+            endDate = newEnd;
+        }
+
+        const signature = [data.status, data.current_price, data.bid_count, data.is_winner].join('|');
+        const changed = signature !== lastSignature || (Array.isArray(data.bids) && data.bids.length > 0);
+        lastSignature = signature;
+        if (changed) {
             applySnapshot({
                 status: data.status,
                 current_price: data.current_price,
@@ -472,15 +593,151 @@ const detail = document.querySelector('.auction-detail-grid[data-auction-id]');
                 winner_name: data.winner_name || data.highest_bidder_name,
                 winner_amount: (data.winner_amount != null) ? data.winner_amount : data.highest_bid_amount,
                 notify_winner: data.notify_winner,
+                delta: !!data.delta,
                 bids: data.bids
             });
-        } catch (e) { /* ignore */ }
+        }
+        if (bidList && data.cursor != null) bidList.dataset.cursor = data.cursor;
+        // A frozen (final) result only changes when an admin reopens the auction; the server's
+        // X-Poll-Interval keeps those polls slow
+        return { changed, hint: isNaN(hint) ? null : hint };
     };
 
-    // Always start immediately + keep polling (proxy-safe)
-    window.__zoltaForceRefresh = fetchState;
-    fetchState();
-    setInterval(fetchState, 2000);
+    // One poller for price, bids and status (proxy-safe, no websockets needed)
+    const poller = createAdaptivePoller(fetchState, {
+        msUntilDeadline: () => (endDate && !isNaN(endDate)) ? endDate - countdownTicker.now() : null
+    });
+    window.__zoltaForceRefresh = () => poller.now();
+    poller.start();
+}
+
+// The server turns polls away while it is busy placing bids; wait as long as it asks
+function shedPoll(res) {
+    const retryAfter = parseFloat(res.headers.get('Retry-After'));
+    return { changed: false, hint: isNaN(retryAfter) ? null : retryAfter };
+}
+
+/**
+ * Poll `task` adaptively. The task resolves to {changed, hint, stop}: `hint` is the server's
+ * X-Poll-Interval in seconds and is never undercut. Unchanged responses stretch the delay
+ * (except in the last minutes before msUntilDeadline), errors back off exponentially and the
+ * poller sleeps while the tab is hidden, polling once right away when it becomes visible again.
+ */
+function createAdaptivePoller(task, options = {}) {
+    const maxIdleDelay = options.maxIdleDelay || 30000;
+    const maxErrorDelay = options.maxErrorDelay || 60000;
+    let hint = options.initialDelay || 2000;
+    let idle = 0;
+    let errors = 0;
+    let timer = null;
+    let running = false;
+    let stopped = false;
+
+    function nextDelay() {
+        if (errors) return Math.max(hint, Math.min(maxErrorDelay, hint * Math.pow(2, errors)));
+        const left = options.msUntilDeadline ? options.msUntilDeadline() : null;
+        if (left != null && left > -5000 && left < 5 * 60 * 1000) return hint;
+        return Math.max(hint, Math.min(maxIdleDelay, hint * Math.pow(1.5, idle)));
+    }
+
+    function schedule(delay) {
+        clearTimeout(timer);
+        timer = null;
+        if (stopped || document.hidden) return;
+        timer = setTimeout(run, delay != null ? delay : nextDelay());
+    }
+
+    async function run() {
+        timer = null;
+        if (stopped || document.hidden) return;
+        running = true;
+        try {
+            const result = (await task()) || {};
+            errors = 0;
+            idle = result.changed ? 0 : idle + 1;
+            if (result.hint > 0) hint = result.hint * 1000;
+            if (result.stop) stopped = true;
+        } catch (e) {
+            errors += 1;
+        }
+        running = false;
+        schedule();
+    }
+
+    document.addEventListener('visibilitychange', () => {
+        if (document.hidden) {
+            clearTimeout(timer);
+            timer = null;
+        } else if (!running) {
+            schedule(0);
+        }
+    });
+
+    return {
+        start() { schedule(0); },
+        now() { idle = 0; if (!running) schedule(0); },
+        stop() { stopped = true; clearTimeout(timer); }
+    };
+}
+
+
+/**
+ * Patch the bid list in place instead of rebuilding it. Rows are keyed by bid id: rows we
+ * already show stay in the DOM, new bids are inserted at their place by amount and only the
+ * top 10 are kept. With `full` the given bids are the complete list (a resync).
+ */
+function patchBidList(list, bids, full) {
+    const MAX_ROWS = 10;
+    const rows = new Map();
+    list.querySelectorAll('.bid-item[data-bid-id]').forEach(row => rows.set(row.dataset.bidId, row));
+
+    const wanted = new Map();
+    if (!full) {
+        rows.forEach((row, id) => wanted.set(id, { id, amount: parseFloat(row.dataset.amount) }));
+    }
+    bids.forEach(b => wanted.set(String(b.id), { id: String(b.id), amount: Number(b.amount), bid: b }));
+    const ordered = Array.from(wanted.values())
+        .sort((a, b) => (b.amount - a.amount) || (Number(b.id) - Number(a.id)))
+        .slice(0, MAX_ROWS);
+    const keep = new Set(ordered.map(e => e.id));
+
+    rows.forEach((row, id) => { if (!keep.has(id)) row.remove(); });
+
+    const empty = list.querySelector('.empty-bids');
+    if (ordered.length && empty) empty.remove();
+    if (!ordered.length && !empty) {
+        const div = document.createElement('div');
+        div.className = 'empty-bids';
+        div.textContent = 'Nog geen biedingen.';
+        list.appendChild(div);
+    }
+
+    // Walk the wanted order and move/insert only rows that are out of place
+    let anchor = list.querySelector('.bid-header');
+    ordered.forEach((entry, idx) => {
+        let row = rows.get(entry.id);
+        if (!row) row = createBidRow(entry.bid);
+        const expected = anchor ? anchor.nextElementSibling : list.firstElementChild;
+        if (row !== expected) list.insertBefore(row, expected);
+        row.classList.toggle('winning', idx === 0);
+        anchor = row;
+    });
+}
+
+function createBidRow(b) {
+    const row = document.createElement('div');
+    row.className = 'bid-item';
+    row.dataset.bidId = b.id;
+    row.dataset.amount = b.amount;
+    const dt = new Date(b.created_at);
+    const pad = (n) => String(n).padStart(2, '0');
+    const ts = isNaN(dt) ? '' :
+        `${pad(dt.getDate())}-${pad(dt.getMonth() + 1)}-${dt.getFullYear()} ${pad(dt.getHours())}:${pad(dt.getMinutes())}`;
+    row.innerHTML = `
+        <div class="bid-name">${escapeHtml(b.name)}</div>
+        <div class="bid-time">${escapeHtml(ts)}</div>
+        <div class="bid-amount">€${Number(b.amount).toFixed(2)}</div>`;
+    return row;
 }
 
 
@@ -539,6 +796,7 @@ function applyAuctionStatusUI(data) {
 
         // Countdown label
         if (countdown) {
+            countdownTicker.remove(countdown);
             countdown.innerHTML = '<span class="countdown-ended">Veiling afgelopen</span>';
         }
     } else if (data.status === 'active') {
@@ -674,4 +932,211 @@ function launchBigConfetti() {
         overlay.appendChild(p);
     }
     setTimeout(() => { overlay.remove(); }, 6500);
-}
\ No newline at end of file
+}
+
+
+function initAdminBidHistory() {
+    const emptyState = document.getElementById('admin-bids-empty');
+    if (emptyState && window.EventSource) {
+        // First bid arrives: reload once to get the full table layout
+        const es = new EventSource(emptyState.dataset.streamUrl);
+        es.onmessage = () => { es.close(); window.location.reload(); };
+        return;
+    }
+
+    const table = document.getElementById('admin-bids');
+    if (!table) return;
+    const tbody = table.querySelector('tbody');
+    const moreBtn = document.getElementById('admin-bids-more');
+    const countEl = document.getElementById('admin-bid-count');
+    let nextCursor = table.dataset.nextCursor || '';
+
+    const winnerBadge = '<span style="background: var(--success-color); color: white; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem;">WINNAAR</span>';
+
+    const buildRow = (b) => {
+        const tr = document.createElement('tr');
+        tr.dataset.bidId = b.id;
+        tr.innerHTML = `
+            <td></td>
+            <td><strong>${escapeHtml(b.name)}</strong></td>
+            <td><a href="mailto:${escapeHtml(b.email)}">${escapeHtml(b.email)}</a></td>
+            <td><strong>€${Number(b.amount).toFixed(2)}</strong></td>
+            <td>${escapeHtml(b.created_at)}</td>`;
+        return tr;
+    };
+
+    // Rank column + winner highlight follow row order
+    const renumber = () => {
+        Array.from(tbody.rows).forEach((tr, idx) => {
+            tr.cells[0].innerHTML = idx === 0 ? winnerBadge : String(idx + 1);
+            tr.style.background = idx === 0 ? '#f0fdf4' : '';
+        });
+    };
+
+    if (moreBtn) {
+        moreBtn.addEventListener('click', async () => {
+            if (!nextCursor) return;
+            moreBtn.disabled = true;
+            try {
+                const url = `${table.dataset.bidsUrl}?cursor=${encodeURIComponent(nextCursor)}`;
+                const res = await fetch(url, { cache: 'no-store' });
+                if (!res.ok) return;
+                const data = await res.json();
+                data.bids.forEach(b => {
+                    if (!tbody.querySelector(`tr[data-bid-id="${b.id}"]`)) tbody.appendChild(buildRow(b));
+                });
+                renumber();
+                nextCursor = data.next_cursor || '';
+                if (!nextCursor) moreBtn.style.display = 'none';
+            } catch (e) {
+                console.error('Failed to load bids:', e);
+            } finally {
+                moreBtn.disabled = false;
+            }
+        });
+    }
+
+    if (window.EventSource && table.dataset.streamUrl) {
+        const es = new EventSource(table.dataset.streamUrl);
+        es.onmessage = (ev) => {
+            let msg = null;
+            try { msg = JSON.parse(ev.data); } catch (e) { return; }
+            // The server dropped our backlog: start over from a fresh page
+            if (msg && msg.type === 'resync') { es.close(); window.location.reload(); return; }
+            if (!msg || msg.type !== 'bid' || !msg.bid) return;
+            if (tbody.querySelector(`tr[data-bid-id="${msg.bid.id}"]`)) return;
+            // New bids always outrank the stored ones, so they go on top
+            tbody.insertBefore(buildRow(msg.bid), tbody.firstChild);
+            renumber();
+            if (countEl && msg.bid_count != null) countEl.textContent = msg.bid_count;
+        };
+    }
+}
+
+
+// Price line + meta of an index card (same wording as templates/_auction_card.html)
+function auctionCardSummary(a) {
+    if (a.status === 'active') {
+        return {
+            priceLine: `€${Number(a.price).toFixed(2)}`,
+            meta: `<span class="auction-status active">Nu live</span><span>${a.bid_count} biedingen</span>`
+        };
+    }
+    if (a.status === 'upcoming') {
+        return {
+            priceLine: `Start vanaf €${Number(a.min_price).toFixed(2)}`,
+            meta: `<span class="auction-status upcoming">Start ${escapeHtml(a.start_label)}</span>`
+        };
+    }
+    return {
+        priceLine: `Verkocht voor €${Number(a.price).toFixed(2)}`,
+        meta: `<span class="auction-status ended">Afgelopen</span><span>${a.bid_count} biedingen</span>`
+    };
+}
+
+function renderAuctionCard(a) {
+    const image = a.image_url
+        ? `<img src="${escapeHtml(a.image_url)}" alt="${escapeHtml(a.title)}" class="auction-card-image" loading="lazy">`
+        : '<div class="auction-card-image placeholder">📦</div>';
+    const { priceLine, meta } = auctionCardSummary(a);
+    const el = document.createElement('a');
+    el.href = a.url;
+    el.className = 'auction-card';
+    el.dataset.cardId = a.id;
+    el.dataset.status = a.status;
+    el.dataset.version = a.version || 0;
+    if (a.status === 'upcoming') el.dataset.auctionStart = a.start_date;
+    el.innerHTML = `
+        ${image}
+        <div class="auction-card-body">
+            <h3 class="auction-card-title">${escapeHtml(a.title)}</h3>
+            <p class="auction-card-description">${escapeHtml(a.description)}</p>
+            <div class="auction-card-price">${priceLine}</div>
+            <div class="auction-card-meta">${meta}</div>
+        </div>`;
+    return el;
+}
+
+function initAuctionBrowser() {
+    document.querySelectorAll('.auctions-grid[data-status]').forEach(grid => {
+        const status = grid.dataset.status;
+        const button = document.querySelector(`[data-load-more="${status}"]`);
+        if (!button) return;
+        let cursor = grid.dataset.nextCursor || '';
+        let loading = false;
+
+        const loadMore = async () => {
+            if (!cursor || loading) return;
+            loading = true;
+            button.disabled = true;
+            try {
+                const params = new URLSearchParams({ status, cursor, q: grid.dataset.query || '' });
+                const res = await fetch(`${grid.dataset.apiUrl}?${params}`, { cache: 'no-store' });
+                if (!res.ok) return;
+                const data = await res.json();
+                const frag = document.createDocumentFragment();
+                data.auctions.forEach(a => {
+                    if (!grid.querySelector(`[data-card-id="${a.id}"]`)) frag.appendChild(renderAuctionCard(a));
+                });
+                grid.appendChild(frag);
+                cursor = data.next_cursor || '';
+                if (!cursor) {
+                    button.remove();
+                    if (observer) observer.disconnect();
+                }
+            } catch (e) {
+                console.error('Failed to load auctions:', e);
+            } finally {
+                loading = false;
+                button.disabled = false;
+            }
+        };
+
+        button.addEventListener('click', loadMore);
+        // Load the next page automatically when the button scrolls into view
+        const observer = ('IntersectionObserver' in window)
+            ? new IntersectionObserver(entries => { if (entries.some(e => e.isIntersecting)) loadMore(); }, { rootMargin: '400px' })
+            : null;
+        if (observer) observer.observe(button);
+    });
+}
+
+/**
+ * Admin dashboard: select auctions for one bulk action
+ */
+function initBulkSelect() {
+    const form = document.getElementById('bulk-form');
+    if (!form) return;
+    const boxes = Array.from(document.querySelectorAll('.bulk-select'));
+    const all = document.getElementById('bulk-select-all');
+    const count = document.getElementById('bulk-count');
+    const submit = document.getElementById('bulk-submit');
+
+    function update() {
+        const n = boxes.filter(b => b.checked).length;
+        if (count) count.textContent = n;
+        if (submit) submit.disabled = n === 0;
+        if (all) {
+            all.checked = n > 0 && n === boxes.length;
+            all.indeterminate = n > 0 && n < boxes.length;
+        }
+    }
+
+    boxes.forEach(b => b.addEventListener('change', update));
+    if (all) {
+        all.addEventListener('change', function() {
+            boxes.forEach(b => { b.checked = all.checked; });
+            update();
+        });
+    }
+
+    form.addEventListener('submit', function(e) {
+        const action = form.elements['action'].value;
+        const n = boxes.filter(b => b.checked).length;
+        if (action === 'delete' &&
+            !confirm('Weet je zeker dat je ' + n + ' veiling(en) wilt verwijderen? Dit kan niet ongedaan worden gemaakt.')) {
+            e.preventDefault();
+        }
+    });
+    update();
+}
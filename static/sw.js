@@ -1,7 +1,28 @@
-/* Zolta Service Worker (basic offline support) */
-const CACHE_NAME = 'zolta-cache-v1.3.2';
-const ASSETS = [
-  "/",
+/* Zolta Service Worker
+ *
+ * One cache per resource class, each with its own strategy:
+ *   static  – CSS/JS/icons/manifest: stale-while-revalidate (new versions arrive on the next visit,
+ *             no hand-bumped cache name needed)
+ *   pages   – "/" and "/auction/<id>": stale-while-revalidate, so repeat visits render instantly and
+ *             the live poller brings prices up to date; max PAGE_MAX_ENTRIES pages. Redirects that
+ *             carry a flash message go to a URL with a query string, which is never served from here
+ *   images  – /static/uploads/*: cache-first with LRU eviction by entry count and total bytes
+ * API calls, streams, admin pages and anything not GET are never cached.
+ * CACHE_LAYOUT only changes when this layout changes; old caches are removed on activate.
+ * Served from /sw.js (see app.py) so its scope covers the whole site.
+ */
+const CACHE_LAYOUT = 'v3';
+const STATIC_CACHE = `zolta-static-${CACHE_LAYOUT}`;
+const PAGE_CACHE = `zolta-pages-${CACHE_LAYOUT}`;
+const IMAGE_CACHE = `zolta-images-${CACHE_LAYOUT}`;
+const KNOWN_CACHES = [STATIC_CACHE, PAGE_CACHE, IMAGE_CACHE];
+
+const PAGE_MAX_ENTRIES = 30;
+const IMAGE_MAX_ENTRIES = 120;
+const IMAGE_MAX_BYTES = 30 * 1024 * 1024;
+const SIZE_HEADER = 'X-SW-Size';
+
+const PRECACHE = [
   "/static/css/style.css",
   "/static/js/main.js",
   "/static/img/zolta-icon.png",
@@ -12,44 +33,128 @@ const ASSETS = [
 
 self.addEventListener("install", (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => cache.addAll(ASSETS)).then(() => self.skipWaiting())
+    Promise.all([
+      caches.open(STATIC_CACHE).then((cache) => cache.addAll(PRECACHE)),
+      caches.open(PAGE_CACHE).then((cache) => cache.add("/")).catch(() => {})
+    ]).then(() => self.skipWaiting())
   );
 });
 
 self.addEventListener("activate", (event) => {
   event.waitUntil(
     Promise.all([
-      caches.keys().then(keys => Promise.all(keys.filter(k => k !== CACHE_NAME).map(k => caches.delete(k)))),
+      caches.keys().then(keys => Promise.all(keys.filter(k => !KNOWN_CACHES.includes(k)).map(k => caches.delete(k)))),
       self.clients.claim()
     ])
   );
 });
 
+function classify(req, url) {
+  if (req.method !== "GET" || url.origin !== self.location.origin) return null;
+  const path = url.pathname;
+  if (path.startsWith("/api/") || path.startsWith("/admin") || path.startsWith("/verify")) return null;
+  if (path.startsWith("/static/uploads/")) return "image";
+  if (path.startsWith("/static/")) return "static";
+  if (req.mode === "navigate" && !url.search && (path === "/" || /^\/auction\/\d+$/.test(path))) return "page";
+  return null;
+}
+
 self.addEventListener("fetch", (event) => {
   const req = event.request;
   const url = new URL(req.url);
+  const kind = classify(req, url);
 
-  // Only handle same-origin requests
-  if (url.origin !== self.location.origin) return;
-
-  // Network-first for HTML navigations
-  if (req.mode === "navigate") {
-    event.respondWith(
-      fetch(req).then((res) => {
-        const copy = res.clone();
-        caches.open(CACHE_NAME).then(cache => cache.put(req, copy));
-        return res;
-      }).catch(() => caches.match(req).then(r => r || caches.match("/")))
-    );
-    return;
+  if (kind === "image") {
+    event.respondWith(cacheFirstImage(event, req));
+  } else if (kind === "static") {
+    event.respondWith(staleWhileRevalidate(event, req, STATIC_CACHE));
+  } else if (kind === "page") {
+    event.respondWith(staleWhileRevalidate(event, req, PAGE_CACHE, PAGE_MAX_ENTRIES));
+  } else if (req.mode === "navigate") {
+    // Uncached pages: network only, with the cached home page as offline fallback
+    event.respondWith(fetch(req).catch(() => caches.match("/", { cacheName: PAGE_CACHE }).then(r => r || Response.error())));
   }
-
-  // Cache-first for static assets
-  event.respondWith(
-    caches.match(req).then((cached) => cached || fetch(req).then((res) => {
-      const copy = res.clone();
-      caches.open(CACHE_NAME).then(cache => cache.put(req, copy));
-      return res;
-    }))
-  );
+  // Everything else (API, SSE, POST, admin assets) goes straight to the network
 });
+
+function cacheable(res) {
+  // Redirected and no-store responses (the server marks pages that showed a flash message) are one-off
+  return res && res.ok && res.type === "basic" && !res.redirected &&
+    !/no-store/.test(res.headers.get("Cache-Control") || "");
+}
+
+async function staleWhileRevalidate(event, req, cacheName, maxEntries) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(req);
+  const network = fetch(req).then(async (res) => {
+    if (cacheable(res)) {
+      await cache.put(req, res.clone());
+      if (maxEntries) await trimByCount(cache, maxEntries);
+    }
+    return res;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+  return network.catch(() => caches.match("/", { cacheName: PAGE_CACHE }).then(r => r || Response.error()));
+}
+
+async function trimByCount(cache, maxEntries) {
+  const keys = await cache.keys();
+  // keys() is in insertion order: put() re-inserts, so the oldest page is first
+  await Promise.all(keys.slice(0, Math.max(0, keys.length - maxEntries)).map(k => cache.delete(k)));
+}
+
+// --- Image LRU ---
+// Recency lives in memory (Map order = least recently used first) and is seeded from the
+// cache's insertion order when the worker starts; sizes are stored on each entry.
+let imageIndex = null;
+
+async function loadImageIndex(cache) {
+  if (imageIndex) return imageIndex;
+  const index = new Map();
+  for (const key of await cache.keys()) {
+    const res = await cache.match(key);
+    index.set(key.url, Number(res && res.headers.get(SIZE_HEADER)) || 0);
+  }
+  imageIndex = index;
+  return index;
+}
+
+async function cacheFirstImage(event, req) {
+  const cache = await caches.open(IMAGE_CACHE);
+  const index = await loadImageIndex(cache);
+  const cached = await cache.match(req);
+  if (cached) {
+    const size = index.get(req.url) || 0;
+    index.delete(req.url);
+    index.set(req.url, size);
+    return cached;
+  }
+
+  const res = await fetch(req);
+  if (cacheable(res)) {
+    event.waitUntil(storeImage(cache, index, req, res.clone()));
+  }
+  return res;
+}
+
+async function storeImage(cache, index, req, res) {
+  const body = await res.blob();
+  if (body.size > IMAGE_MAX_BYTES) return;
+  const headers = new Headers(res.headers);
+  headers.set(SIZE_HEADER, String(body.size));
+  await cache.put(req, new Response(body, { status: res.status, statusText: res.statusText, headers }));
+  index.delete(req.url);
+  index.set(req.url, body.size);
+
+  let total = 0;
+  index.forEach(size => { total += size; });
+  for (const [url, size] of index) {
+    if (index.size <= IMAGE_MAX_ENTRIES && total <= IMAGE_MAX_BYTES) break;
+    index.delete(url);
+    total -= size;
+    await cache.delete(url);
+  }
+}